@@ -7,13 +7,22 @@ Provides HTTP API endpoints and serves the web interface
 import os
 import sys
 import json
+import gzip
 import psutil
 import subprocess
 import time
+from dataclasses import dataclass
+from functools import wraps
 from flask import Flask, request, jsonify, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import bot components
 try:
     from bot_launcher import BotManager
@@ -35,8 +44,20 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that serializes and parses with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
+if orjson is not None:
+    # Covers jsonify() and request.get_json() without touching the call sites
+    app.json = OrjsonProvider(app)
 # Secure CORS configuration
 CORS(app, 
      origins=['http://localhost:3000', 'http://localhost:5173', 'https://localhost:5173'],
@@ -44,37 +65,94 @@ CORS(app,
      allow_headers=['Content-Type', 'Authorization'],
      supports_credentials=True)
 
-# Global process tracking
+# Responses smaller than this are not worth the gzip framing overhead
+GZIP_MIN_SIZE = 1024
+GZIP_MIMETYPES = ('application/json', 'text/html', 'text/css', 'application/javascript')
+
+@app.after_request
+def gzip_response(response):
+    """Gzip larger text/JSON responses for clients that accept it"""
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code >= 300
+            or response.mimetype not in GZIP_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    # The body depends on Accept-Encoding whether or not this particular response is compressed
+    response.vary.add('Accept-Encoding')
+    if 'gzip' not in request.headers.get('Accept-Encoding', '').lower():
+        return response
+    
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+@dataclass(frozen=True)
+class ServiceSpec:
+    """A backend service script that the API server can start and stop"""
+    script: str
+    label: str
+
+# Services managed through /api/backend/<action>/<service>
+SERVICE_REGISTRY = {
+    'websocket': ServiceSpec(script='websocket_server.py', label='WebSocket'),
+}
+
+def unknown_service_response(service):
+    """Error response for a service name missing from SERVICE_REGISTRY"""
+    return jsonify({
+        'success': False,
+        'error': f'Unknown service: {service}'
+    }), 400
+
+# Global process tracking, keyed by SERVICE_REGISTRY name
 running_processes = {}
 
+# Reused so cpu_percent() measures against the previous call instead of returning 0.0
+api_process = psutil.Process(os.getpid())
+
+# Service scans only consider processes we own (and could signal); uids are POSIX-only
+CURRENT_UID = os.getuid() if hasattr(os, 'getuid') else None
+SERVICE_SCAN_ATTRS = ['uids'] if CURRENT_UID is not None else None
+
+# The health payload never changes (boot_time is fixed), so serialize it once
+HEALTH_RESPONSE_BODY = app.json.dumps({
+    'success': True,
+    'status': 'healthy',
+    'timestamp': psutil.boot_time(),
+    'api_server': 'running'
+})
+
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'success': True,
-        'status': 'healthy',
-        'timestamp': psutil.boot_time(),
-        'api_server': 'running'
-    })
+    return app.response_class(HEALTH_RESPONSE_BODY, mimetype='application/json')
 
 @app.route('/api/backend/status')
 def get_backend_status():
     """Get status of all backend services"""
     try:
-        services = {
-            'api_server': {
+        with api_process.oneshot():
+            api_server = {
                 'running': True,
-                'pid': os.getpid(),
+                'pid': api_process.pid,
                 'status': 'running',
-                'cpu_percent': psutil.Process(os.getpid()).cpu_percent(),
-                'memory_percent': psutil.Process(os.getpid()).memory_percent()
-            },
-            'websocket': {
-                'running': is_service_running('websocket_server.py'),
-                'pid': get_service_pid('websocket_server.py'),
-                'status': 'running' if is_service_running('websocket_server.py') else 'stopped'
+                'cpu_percent': api_process.cpu_percent(),
+                'memory_percent': api_process.memory_percent()
+            }
+        
+        services = {'api_server': api_server}
+        for name, spec in SERVICE_REGISTRY.items():
+            process = find_service_process(spec.script)
+            services[name] = {
+                'running': process is not None,
+                'pid': process.pid if process else None,
+                'status': 'running' if process else 'stopped'
             }
-        }
         
         return jsonify({
             'success': True,
@@ -94,7 +172,7 @@ def get_bot_status():
         return jsonify({
             'success': True,
             'status': 'operational',
-            'websocket_running': is_service_running('websocket_server.py'),
+            'websocket_running': is_service_running(SERVICE_REGISTRY['websocket'].script),
             'api_server_running': True
         })
     except Exception as e:
@@ -104,66 +182,65 @@ def get_bot_status():
             'error': str(e)
         }), 500
 
+def json_endpoint(*required):
+    """Validate a BotManager-backed JSON POST and pass the parsed body to the view"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                if BotManager is None:
+                    return jsonify({
+                        'success': False,
+                        'error': 'BotManager not available'
+                    }), 503
+                
+                # silent: a missing or malformed body is a 400, not a 415/500
+                data = request.get_json(silent=True)
+                if not isinstance(data, dict):
+                    return jsonify({
+                        'success': False,
+                        'error': 'JSON object body required'
+                    }), 400
+                
+                missing = [name for name in required if name not in data]
+                if missing:
+                    return jsonify({
+                        'success': False,
+                        'error': f'{missing[0].capitalize()} field required'
+                    }), 400
+                
+                return view(data, *args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error in {view.__name__} endpoint: {e}")
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 500
+        return wrapper
+    return decorator
+
 @app.route('/api/humanize', methods=['POST'])
-def humanize_text():
+@json_endpoint('text')
+def humanize_text(data):
     """Humanize text endpoint"""
-    try:
-        if BotManager is None:
-            return jsonify({
-                'success': False,
-                'error': 'BotManager not available'
-            }), 503
-            
-        data = request.get_json()
-        if not data or 'text' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'Text field required'
-            }), 400
-            
-        # Placeholder response - actual implementation would use BotManager
-        return jsonify({
-            'success': True,
-            'humanized_text': data['text'],  # Placeholder
-            'message': 'Text processing complete'
-        })
-    except Exception as e:
-        logger.error(f"Error in humanize endpoint: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    # Placeholder response - actual implementation would use BotManager
+    return jsonify({
+        'success': True,
+        'humanized_text': data['text'],  # Placeholder
+        'message': 'Text processing complete'
+    })
 
 @app.route('/api/detect', methods=['POST'])
-def detect_ai_text():
+@json_endpoint('text')
+def detect_ai_text(data):
     """AI text detection endpoint"""
-    try:
-        if BotManager is None:
-            return jsonify({
-                'success': False,
-                'error': 'BotManager not available'
-            }), 503
-            
-        data = request.get_json()
-        if not data or 'text' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'Text field required'
-            }), 400
-            
-        # Placeholder response - actual implementation would use BotManager
-        return jsonify({
-            'success': True,
-            'is_ai_generated': False,  # Placeholder
-            'confidence': 0.5,
-            'message': 'Detection complete'
-        })
-    except Exception as e:
-        logger.error(f"Error in detect endpoint: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    # Placeholder response - actual implementation would use BotManager
+    return jsonify({
+        'success': True,
+        'is_ai_generated': False,  # Placeholder
+        'confidence': 0.5,
+        'message': 'Detection complete'
+    })
 
 @app.route('/api/backend/start/<service>', methods=['POST'])
 def start_service(service):
@@ -175,38 +252,35 @@ def start_service(service):
                 'message': 'API Server is already running'
             })
         
-        elif service == 'websocket':
-            if is_service_running('websocket_server.py'):
-                return jsonify({
-                    'success': False,
-                    'error': 'WebSocket server is already running'
-                })
-            
-            # Ensure proper process tracking
-            process = subprocess.Popen([
-                sys.executable, 'websocket_server.py'
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            running_processes['websocket'] = process
-            
-            # Give the process time to start
-            time.sleep(2)
-            
-            if process.poll() is None:  # Process is still running
-                return jsonify({
-                    'success': True,
-                    'message': f'WebSocket server started with PID {process.pid}'
-                })
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': 'WebSocket server failed to start'
-                })
+        spec = SERVICE_REGISTRY.get(service)
+        if spec is None:
+            return unknown_service_response(service)
         
+        if is_service_running(spec.script):
+            return jsonify({
+                'success': False,
+                'error': f'{spec.label} server is already running'
+            })
+        
+        # Ensure proper process tracking
+        process = subprocess.Popen([
+            sys.executable, spec.script
+        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        running_processes[service] = process
+        
+        # Give the process time to start
+        time.sleep(2)
+        
+        if process.poll() is None:  # Process is still running
+            return jsonify({
+                'success': True,
+                'message': f'{spec.label} server started with PID {process.pid}'
+            })
         else:
             return jsonify({
                 'success': False,
-                'error': f'Unknown service: {service}'
-            }), 400
+                'error': f'{spec.label} server failed to start'
+            })
             
     except Exception as e:
         logger.error(f"Error starting {service}: {e}")
@@ -225,44 +299,38 @@ def stop_service(service):
                 'error': 'Cannot stop API server from itself'
             }), 400
         
-        elif service == 'websocket':
-            script_name = 'websocket_server.py'
-            
-            # Find and terminate the process
-            terminated = False
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    if proc.info['cmdline'] and script_name in ' '.join(proc.info['cmdline']):
-                        proc.terminate()
-                        terminated = True
-                        break
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            # Also clean up from running_processes if exists
-            if 'websocket' in running_processes:
-                try:
-                    running_processes['websocket'].terminate()
-                    del running_processes['websocket']
-                except:
-                    pass
-            
-            if terminated:
-                return jsonify({
-                    'success': True,
-                    'message': 'WebSocket service stopped'
-                })
-            else:
-                        return jsonify({
-                            'success': True,
-                    'message': 'WebSocket service was not running'
-                        })
+        spec = SERVICE_REGISTRY.get(service)
+        if spec is None:
+            return unknown_service_response(service)
+        
+        # Find and terminate the process
+        terminated = False
+        proc = find_service_process(spec.script)
+        if proc is not None:
+            try:
+                proc.terminate()
+                terminated = True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
         
+        # Also clean up from running_processes if exists
+        tracked = running_processes.pop(service, None)
+        if tracked is not None:
+            try:
+                tracked.terminate()
+            except Exception:
+                pass
+        
+        if terminated:
+            return jsonify({
+                'success': True,
+                'message': f'{spec.label} service stopped'
+            })
         else:
             return jsonify({
-                'success': False,
-                'error': f'Unknown service: {service}'
-            }), 400
+                'success': True,
+                'message': f'{spec.label} service was not running'
+            })
             
     except Exception as e:
         logger.error(f"Error stopping {service}: {e}")
@@ -275,6 +343,10 @@ def stop_service(service):
 def restart_service(service):
     """Restart a backend service"""
     try:
+        # Reject unknown services before stopping anything or waiting out the restart delay
+        if service != 'api_server' and service not in SERVICE_REGISTRY:
+            return unknown_service_response(service)
+        
         # Stop the service first
         stop_response = stop_service(service)
         
@@ -292,27 +364,47 @@ def restart_service(service):
             'error': str(e)
         }), 500
 
-def is_service_running(script_name):
-    """Check if a service script is running"""
+def find_service_process(script_name):
+    """Find the process running a service script, or None if it is not running"""
     try:
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            if proc.info['cmdline'] and script_name in ' '.join(proc.info['cmdline']):
-                return True
-        return False
+        # Filter on the cheap uid field before reading each process's cmdline
+        for proc in psutil.process_iter(SERVICE_SCAN_ATTRS):
+            if CURRENT_UID is not None:
+                uids = proc.info['uids']
+                if uids is None or uids.real != CURRENT_UID:
+                    continue
+            try:
+                cmdline = proc.cmdline()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            # Kernel threads report an empty cmdline
+            if cmdline and script_name in ' '.join(cmdline):
+                return proc
+        return None
     except Exception:
-        return False
+        return None
+
+def is_service_running(script_name):
+    """Check if a service script is running"""
+    return find_service_process(script_name) is not None
 
 def get_service_pid(script_name):
     """Get the PID of a running service"""
-    try:
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            if proc.info['cmdline'] and script_name in ' '.join(proc.info['cmdline']):
-                return proc.info['pid']
-        return None
-    except Exception:
-        return None
+    proc = find_service_process(script_name)
+    return proc.pid if proc else None
 
 if __name__ == '__main__':
+    debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes')
     logger.info("🚀 Starting Bot Management API Server...")
     logger.info("📊 API Server available at http://0.0.0.0:5000")
-    app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
+    
+    # Prefer a production WSGI server; the Werkzeug dev server is the fallback and the debug path
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+    
+    if serve is not None and not debug:
+        serve(app, host='0.0.0.0', port=5000, threads=16)
+    else:
+        app.run(host='0.0.0.0', port=5000, debug=debug)
\ No newline at end of file
@@ -6,159 +6,138 @@ This script patches the most critical issues in the existing codebase.
 
 import os
 import shutil
-import re
+from pathlib import Path
 
 def backup_file(filepath):
     """Create backup of original file"""
     backup_path = f"{filepath}.backup"
-    shutil.copy2(filepath, backup_path)
+    # A hard link costs no copy; rewrite_file replaces the path with a new inode, so the link keeps the original
+    try:
+        if os.path.lexists(backup_path):
+            os.remove(backup_path)
+        os.link(filepath, backup_path)
+    except OSError:
+        # Cross-device, FAT and other filesystems without hard links
+        shutil.copy2(filepath, backup_path)
     print(f"Created backup: {backup_path}")
 
+def rewrite_file(filepath, transform):
+    """Back up a file, run transform over its text and write it back if it changed"""
+    path = Path(filepath)
+    if not path.exists():
+        print(f"File not found: {filepath}")
+        return False
+    
+    backup_file(path)
+    
+    content = path.read_text(encoding='utf-8')
+    new_content = transform(content)
+    if new_content != content:
+        # Write a new file and swap it in; truncating in place would also rewrite the hard-linked backup
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_text(new_content, encoding='utf-8')
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    return True
+
 def fix_self_aware_module():
     """Fix cross-platform issues in self_aware_module.py"""
     filepath = "self_aware_module.py"
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return
-    
-    backup_file(filepath)
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Fix hard-coded disk path
-    old_disk_usage = 'disk_usage = psutil.disk_usage("/")'
-    new_disk_usage = '''# Cross-platform disk usage
+    def transform(content):
+        # Fix hard-coded disk path
+        old_disk_usage = 'disk_usage = psutil.disk_usage("/")'
+        new_disk_usage = '''# Cross-platform disk usage
             if os.name == 'nt':  # Windows
                 disk_usage = psutil.disk_usage("C:\\\\")
             else:  # Unix-like systems
                 disk_usage = psutil.disk_usage("/")'''
+        
+        content = content.replace(old_disk_usage, new_disk_usage)
+        
+        # Add os import if not present
+        if 'import os' not in content:
+            content = content.replace('import psutil', 'import psutil\nimport os')
+        return content
     
-    content = content.replace(old_disk_usage, new_disk_usage)
-    
-    # Add os import if not present
-    if 'import os' not in content:
-        content = content.replace('import psutil', 'import psutil\nimport os')
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"Fixed cross-platform disk usage in {filepath}")
+    if rewrite_file(filepath, transform):
+        print(f"Fixed cross-platform disk usage in {filepath}")
 
 def fix_command_interface():
     """Fix security and path issues in command_interface.py"""
     filepath = "command_interface.py"
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return
-    
-    backup_file(filepath)
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
     
-    # Replace hard-coded /home/ubuntu/ paths
-    content = re.sub(
-        r'/home/ubuntu/',
-        'os.path.expanduser("~") + os.sep',
-        content
-    )
-    
-    # Fix subprocess call to use current directory
-    old_subprocess = 'abs_script_path = os.path.abspath(script_path)'
-    new_subprocess = '''abs_script_path = os.path.abspath(script_path)
+    def transform(content):
+        # Replace hard-coded /home/ubuntu/ paths
+        content = content.replace('/home/ubuntu/', 'os.path.expanduser("~") + os.sep')
+        
+        # Fix subprocess call to use current directory
+        old_subprocess = 'abs_script_path = os.path.abspath(script_path)'
+        new_subprocess = '''abs_script_path = os.path.abspath(script_path)
         
         # Security check - only allow scripts in current directory tree
         allowed_root = os.path.abspath(os.getcwd())
         if not abs_script_path.startswith(allowed_root):
             return f"Error: Script must be in current directory tree: {abs_script_path}"'''
+        
+        return content.replace(old_subprocess, new_subprocess)
     
-    if old_subprocess in content:
-        content = content.replace(old_subprocess, new_subprocess)
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"Fixed security and path issues in {filepath}")
+    if rewrite_file(filepath, transform):
+        print(f"Fixed security and path issues in {filepath}")
 
 def fix_api_server_cors():
     """Fix CORS security in api_server.py"""
     filepath = "api_server.py"
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return
-    
-    backup_file(filepath)
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Replace insecure CORS
-    old_cors = "CORS(app)"
-    new_cors = '''# Secure CORS configuration
+    def transform(content):
+        # Replace insecure CORS
+        old_cors = "CORS(app)"
+        new_cors = '''# Secure CORS configuration
 CORS(app, 
      origins=['http://localhost:3000', 'http://localhost:5173', 'https://localhost:5173'],
      methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
      allow_headers=['Content-Type', 'Authorization'],
      supports_credentials=True)'''
+        
+        return content.replace(old_cors, new_cors)
     
-    if old_cors in content:
-        content = content.replace(old_cors, new_cors)
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"Fixed CORS security in {filepath}")
+    if rewrite_file(filepath, transform):
+        print(f"Fixed CORS security in {filepath}")
 
 def fix_websocket_imports():
     """Fix import handling in websocket_server.py"""
     filepath = "websocket_server.py"
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return
-    
-    backup_file(filepath)
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Add import error handling
-    old_import = "import websockets"
-    new_import = '''try:
+    def transform(content):
+        # Add import error handling
+        old_import = "import websockets"
+        new_import = '''try:
     import websockets
 except ImportError:
     print("Error: websockets module not installed. Run: pip install websockets")
     import sys
     sys.exit(1)'''
+        
+        if "try:" in content[:200]:
+            return content
+        return content.replace(old_import, new_import, 1)
     
-    if old_import in content and "try:" not in content[:200]:
-        content = content.replace(old_import, new_import, 1)
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"Fixed import handling in {filepath}")
+    if rewrite_file(filepath, transform):
+        print(f"Fixed import handling in {filepath}")
 
 def fix_bot_launcher_shebang():
     """Fix shebang in bot_launcher.py for better compatibility"""
     filepath = "bot_launcher.py"
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}")
-        return
-    
-    backup_file(filepath)
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Fix shebang
-    if content.startswith("#!/usr/bin/env python3.11"):
-        content = content.replace("#!/usr/bin/env python3.11", "#!/usr/bin/env python3", 1)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    def transform(content):
+        # Fix shebang
+        old_shebang = "#!/usr/bin/env python3.11"
+        if content.startswith(old_shebang):
+            return "#!/usr/bin/env python3" + content[len(old_shebang):]
+        return content
     
-    print(f"Fixed shebang in {filepath}")
+    if rewrite_file(filepath, transform):
+        print(f"Fixed shebang in {filepath}")
 
 def main():
     """Apply all critical fixes"""
@@ -5,14 +5,31 @@ import os
 import sys
 import logging
 import json
+from collections import deque
 from datetime import datetime
 
-# Import all bot modules
-from self_aware_module import SelfAwareModule
-from self_healing_coding_module import SelfHealingModule, SelfCodingModule
-from text_humanization_module import TextHumanizer
-from ai_text_detection_module import AITextDetector
-from command_interface import CommandInterface
+# Config and history files are read/written with orjson when available
+try:
+    import orjson
+    
+    def load_json_file(path):
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    def dump_json_file(data, path):
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+except ImportError:
+    def load_json_file(path):
+        with open(path, 'r') as f:
+            return json.load(f)
+    
+    def dump_json_file(data, path):
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+# Bot modules are imported in BotManager.initialize_modules so --version/--help stay fast;
+# TextHumanizer and AITextDetector load transformer models and are imported on first use
 
 # --- Configuration ---
 # Create logs directory in current working directory for cross-platform compatibility
@@ -20,6 +37,8 @@ LOGS_DIR = os.path.join(os.getcwd(), "logs")
 os.makedirs(LOGS_DIR, exist_ok=True)
 CONFIG_FILE = os.path.join(os.getcwd(), "bot_config.json")
 MAIN_LOG_FILE = os.path.join(LOGS_DIR, "bot_main.log")
+# Interactive history keeps only the most recent commands
+MAX_COMMAND_HISTORY = 10000
 
 def setup_main_logger():
     formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -55,8 +74,7 @@ def create_default_config():
         }
     }
     
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(default_config, f, indent=2)
+    dump_json_file(default_config, CONFIG_FILE)
     
     return default_config
 
@@ -66,12 +84,50 @@ def load_config():
         return create_default_config()
     
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+        return load_json_file(CONFIG_FILE)
     except Exception as e:
         print(f"Error loading config: {e}. Using defaults.")
         return create_default_config()
 
+class LazyModule:
+    """Proxy that builds the wrapped module on first attribute access."""
+    
+    def __init__(self, factory, logger, description):
+        self._factory = factory
+        self._logger = logger
+        self._description = description
+        self._instance = None
+        self._load_error = None
+    
+    def __getattr__(self, name):
+        # Only reached for names the proxy itself lacks; read its own state without re-entering __getattr__
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            instance = object.__getattribute__(self, "_load")()
+        return getattr(instance, name)
+    
+    def _load(self):
+        """Build the wrapped module once; a failed load is remembered and re-raised on later use."""
+        if self._load_error is not None:
+            raise RuntimeError(f"{self._description} module is unavailable: {self._load_error}") from self._load_error
+        self._logger.info(f"Loading {self._description} (this may take a moment)...")
+        try:
+            self._instance = self._factory()
+        except Exception as e:
+            self._load_error = e
+            self._logger.error(f"Failed to load {self._description} module: {e}", exc_info=True)
+            raise RuntimeError(f"{self._description} module is unavailable: {e}") from e
+        self._logger.info(f"✓ {self._description} module loaded")
+        return self._instance
+
+def load_text_humanizer(model_name):
+    from text_humanization_module import TextHumanizer
+    return TextHumanizer(model_name=model_name)
+
+def load_ai_detector(model_name):
+    from ai_text_detection_module import AITextDetector
+    return AITextDetector(model_name=model_name)
+
 class BotManager:
     def __init__(self):
         self.logger = setup_main_logger()
@@ -84,6 +140,10 @@ class BotManager:
         self.logger.info("Initializing bot modules...")
         
         try:
+            from self_aware_module import SelfAwareModule
+            from self_healing_coding_module import SelfHealingModule, SelfCodingModule
+            from command_interface import CommandInterface
+            
             # Initialize self-awareness module
             if self.config["modules"]["self_aware"]["enabled"]:
                 self.modules["awareness"] = SelfAwareModule()
@@ -103,21 +163,21 @@ class BotManager:
                 )
                 self.logger.info("✓ Self-Coding module initialized")
             
-            # Initialize text humanizer (may take time to download model)
+            # Text humanizer is loaded on first use (model download happens then)
             if self.config["modules"]["text_humanizer"]["enabled"]:
-                self.logger.info("Loading Text Humanizer (this may take a moment)...")
-                self.modules["humanizer"] = TextHumanizer(
-                    model_name=self.config["modules"]["text_humanizer"]["model"]
+                self.modules["humanizer"] = LazyModule(
+                    lambda: load_text_humanizer(self.config["modules"]["text_humanizer"]["model"]),
+                    self.logger, "Text Humanizer"
                 )
-                self.logger.info("✓ Text Humanizer module initialized")
+                self.logger.info("✓ Text Humanizer module registered (loads on first use)")
             
-            # Initialize AI detector (may take time to download model)
+            # AI detector is loaded on first use (model download happens then)
             if self.config["modules"]["ai_detector"]["enabled"]:
-                self.logger.info("Loading AI Text Detector (this may take a moment)...")
-                self.modules["ai_detector"] = AITextDetector(
-                    model_name=self.config["modules"]["ai_detector"]["model"]
+                self.modules["ai_detector"] = LazyModule(
+                    lambda: load_ai_detector(self.config["modules"]["ai_detector"]["model"]),
+                    self.logger, "AI Text Detector"
                 )
-                self.logger.info("✓ AI Text Detector module initialized")
+                self.logger.info("✓ AI Text Detector module registered (loads on first use)")
             
             # Initialize command interface
             self.command_interface = CommandInterface(
@@ -165,7 +225,7 @@ class BotManager:
         """Run the bot in interactive command-line mode."""
         self.print_startup_banner()
         
-        command_history = []
+        command_history = deque(maxlen=MAX_COMMAND_HISTORY)
         
         try:
             while True:
@@ -212,8 +272,7 @@ class BotManager:
         if self.config["interface"]["command_history"] and command_history:
             history_file = "/home/ubuntu/bot_command_history.json"
             try:
-                with open(history_file, 'w') as f:
-                    json.dump(command_history, f, indent=2)
+                dump_json_file(list(command_history), history_file)
                 self.logger.info(f"Command history saved to {history_file}")
             except Exception as e:
                 self.logger.error(f"Failed to save command history: {e}")
@@ -9,15 +9,51 @@ import asyncio
 import json
 import uuid
 import time
-import threading
-from datetime import datetime
+import itertools
+from collections import deque
 from typing import Dict, List, Optional, Any
 from enum import Enum
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
-import queue
+from dataclasses import dataclass, field
 import websockets
-import weakref
+
+from websocket_codec import encode_frame, decode_frame, error_frame, negotiate_codec
+
+# Director commands remembered in command_history; older entries are discarded
+MAX_COMMAND_HISTORY = 10000
+
+# Frames buffered per websocket client; the oldest is dropped when it overflows
+WEBSOCKET_SEND_QUEUE_SIZE = 64
+# Incoming messages larger than this (bytes/chars) are decoded off the event loop
+LARGE_MESSAGE_SIZE = 16 * 1024
+# Director commands that change what get_status reports
+STATUS_MUTATING_COMMANDS = frozenset({
+    'create_bot', 'create_swarm', 'start_bot', 'stop_bot', 'start_swarm', 'stop_swarm'
+})
+# Status updates triggered by commands are coalesced into one broadcast per window (seconds)
+STATUS_UPDATE_DELAY = 0.05
+# Longest gap between status broadcasts when nothing changes (seconds)
+STATUS_HEARTBEAT_INTERVAL = 30
+
+# Server-assigned command ids: a per-process random prefix plus a counter, so
+# incoming messages don't cost an os.urandom call each
+_COMMAND_ID_PREFIX = uuid.uuid4().hex[:12]
+_command_counter = itertools.count(1)
+
+def new_command_id() -> str:
+    """Return a process-unique command id"""
+    return f"{_COMMAND_ID_PREFIX}-{next(_command_counter):x}"
+
+# Await a batch of coroutines together and return their results in order:
+# TaskGroup (3.11+) cancels the rest on failure
+if hasattr(asyncio, 'TaskGroup'):
+    async def run_all(coros):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+        return [task.result() for task in tasks]
+else:
+    async def run_all(coros):
+        return await asyncio.gather(*coros)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -41,7 +77,17 @@ class BotType(Enum):
     EXECUTOR = "executor"
     CUSTOM = "custom"
 
-@dataclass
+# Bot type that handles each delegable command type
+COMMAND_BOT_TYPES = {
+    'analyze_code': BotType.ANALYZER,
+    'quality_check': BotType.ANALYZER,
+    'generate_code': BotType.GENERATOR,
+    'create_tests': BotType.GENERATOR,
+    'health_check': BotType.MONITOR,
+    'monitor_system': BotType.MONITOR
+}
+
+@dataclass(slots=True)
 class BotCommand:
     """Command structure for bot communication"""
     command_id: str
@@ -57,8 +103,20 @@ class BotCommand:
             self.timestamp = time.time()
         if self.parameters is None:
             self.parameters = {}
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict of the command fields (cheaper than dataclasses.asdict)"""
+        return {
+            'command_id': self.command_id,
+            'command_type': self.command_type,
+            'target_bot': self.target_bot,
+            'target_swarm': self.target_swarm,
+            'parameters': self.parameters,
+            'timestamp': self.timestamp,
+            'priority': self.priority
+        }
 
-@dataclass
+@dataclass(slots=True)
 class BotMetrics:
     """Bot performance metrics"""
     commands_executed: int = 0
@@ -67,7 +125,70 @@ class BotMetrics:
     memory_usage: float = 0
     last_activity: float = None
     error_count: int = 0
-    success_rate: float = 100.0
+    
+    @property
+    def success_rate(self) -> float:
+        """Percentage of executed commands that did not fail"""
+        if not self.commands_executed:
+            return 100.0
+        return (self.commands_executed - self.error_count) / self.commands_executed * 100
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict of the metrics (cheaper than dataclasses.asdict)"""
+        return {
+            'commands_executed': self.commands_executed,
+            'uptime': self.uptime,
+            'cpu_usage': self.cpu_usage,
+            'memory_usage': self.memory_usage,
+            'last_activity': self.last_activity,
+            'error_count': self.error_count,
+            'success_rate': self.success_rate
+        }
+
+@dataclass
+class WebSocketClient:
+    """Per-connection send queue and relay task for a websocket client"""
+    websocket: Any
+    codec: str = 'json'
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=WEBSOCKET_SEND_QUEUE_SIZE))
+    relay_task: Optional[asyncio.Task] = None
+    # Broadcast topics this client wants (message types or 'bot:<bot_id>'); None means everything
+    topics: Optional[frozenset] = None
+    
+    def wants(self, event: Dict[str, Any]) -> bool:
+        """Whether a broadcast event matches this client's subscription"""
+        topics = self.topics
+        if topics is None or event['type'] in topics:
+            return True
+        bot_id = event.get('bot_id')
+        return bot_id is not None and f"bot:{bot_id}" in topics
+
+class CommandInbox:
+    """Per-bot command inbox: a deque drained in full on each wake-up of a single event"""
+    
+    def __init__(self):
+        self._commands = deque()
+        self._ready = asyncio.Event()
+    
+    def __len__(self):
+        return len(self._commands)
+    
+    def put_nowait(self, command: BotCommand):
+        """Queue a command and wake the bot's command loop"""
+        self._commands.append(command)
+        self._ready.set()
+    
+    def popleft(self) -> BotCommand:
+        return self._commands.popleft()
+    
+    def wake(self):
+        """Wake the command loop without queuing anything (used on stop)"""
+        self._ready.set()
+    
+    async def wait(self):
+        """Wait until commands are queued or the inbox is woken"""
+        await self._ready.wait()
+        self._ready.clear()
 
 class BaseBotInterface(ABC):
     """Abstract base class for all bots"""
@@ -76,14 +197,35 @@ class BaseBotInterface(ABC):
         self.bot_id = bot_id
         self.bot_type = bot_type
         self.name = name or f"{bot_type.value}_{bot_id[:8]}"
-        self.status = BotStatus.IDLE
-        self.created_at = time.time()
+        self.status_observer = None  # called as observer(bot, old_status, new_status)
+        self._status = BotStatus.IDLE
+        self.created_at = time.time()  # wall clock, reported to clients
+        self.created_monotonic = time.monotonic()  # for uptime, immune to clock adjustments
+        # Fields of get_status() that never change after construction
+        self._static_status = {
+            'bot_id': self.bot_id,
+            'name': self.name,
+            'type': self.bot_type.value,
+            'created_at': self.created_at
+        }
         self.metrics = BotMetrics()
-        self.command_queue = asyncio.Queue()
+        self.command_queue = CommandInbox()
         self.is_running = False
         self.logger = logging.getLogger(f"Bot.{self.name}")
         self.listeners = set()
+        self._listener_snapshot = ()  # rebuilt on add/remove so notifying never copies the set
         
+    @property
+    def status(self) -> BotStatus:
+        return self._status
+    
+    @status.setter
+    def status(self, value: BotStatus):
+        old_status = self._status
+        self._status = value
+        if old_status is not value and self.status_observer is not None:
+            self.status_observer(self, old_status, value)
+    
     @abstractmethod
     async def execute_command(self, command: BotCommand) -> Dict[str, Any]:
         """Execute a specific command"""
@@ -101,32 +243,32 @@ class BaseBotInterface(ABC):
     
     def get_status(self) -> Dict[str, Any]:
         """Get current bot status"""
+        # A fresh dict each call: status dicts are held by queued broadcasts and must not change under them
         return {
-            'bot_id': self.bot_id,
-            'name': self.name,
-            'type': self.bot_type.value,
+            **self._static_status,
             'status': self.status.value,
-            'created_at': self.created_at,
-            'uptime': time.time() - self.created_at,
-            'metrics': asdict(self.metrics),
+            'uptime': time.monotonic() - self.created_monotonic,
+            'metrics': self.metrics.as_dict(),
             'is_running': self.is_running
         }
     
     def add_listener(self, callback):
         """Add status change listener"""
         self.listeners.add(callback)
+        self._listener_snapshot = tuple(self.listeners)
     
     def remove_listener(self, callback):
         """Remove status change listener"""
         self.listeners.discard(callback)
+        self._listener_snapshot = tuple(self.listeners)
     
     def _notify_listeners(self, event_type: str, data: Dict[str, Any]):
         """Notify all listeners of status changes"""
-        for callback in self.listeners.copy():
+        for callback in self._listener_snapshot:
             try:
                 callback(self.bot_id, event_type, data)
             except Exception as e:
-                self.logger.error(f"Listener notification failed: {e}")
+                self.logger.error("Listener notification failed: %s", e)
 
 class SubBot(BaseBotInterface):
     """Base implementation for Sub Bots"""
@@ -188,18 +330,12 @@ class SubBot(BaseBotInterface):
             if not handler:
                 raise ValueError(f"Unknown command type: {command.command_type}")
             
-            self.logger.info(f"Executing command: {command.command_type}")
-            result = await handler(command)
-            
-            # Update success rate
-            success_count = self.metrics.commands_executed - self.metrics.error_count
-            self.metrics.success_rate = (success_count / self.metrics.commands_executed) * 100
-            
-            return result
+            self.logger.info("Executing command: %s", command.command_type)
+            return await handler(command)
             
         except Exception as e:
             self.metrics.error_count += 1
-            self.logger.error(f"Command execution failed: {e}")
+            self.logger.error("Command execution failed: %s", e)
             return {
                 'status': 'error',
                 'message': str(e),
@@ -210,7 +346,7 @@ class SubBot(BaseBotInterface):
         """Start the Sub Bot"""
         self.status = BotStatus.STARTING
         self.is_running = True
-        self.logger.info(f"Starting {self.name}")
+        self.logger.info("Starting %s", self.name)
         
         # Start command processing loop
         asyncio.create_task(self._command_loop())
@@ -222,7 +358,8 @@ class SubBot(BaseBotInterface):
         """Stop the Sub Bot"""
         self.status = BotStatus.STOPPING
         self.is_running = False
-        self.logger.info(f"Stopping {self.name}")
+        self.command_queue.wake()
+        self.logger.info("Stopping %s", self.name)
         
         self.status = BotStatus.STOPPED
         self._notify_listeners('stopped', self.get_status())
@@ -230,32 +367,28 @@ class SubBot(BaseBotInterface):
     async def _command_loop(self):
         """Main command processing loop"""
         while self.is_running:
-            try:
-                # Wait for commands with timeout
-                command = await asyncio.wait_for(
-                    self.command_queue.get(), 
-                    timeout=1.0
-                )
-                
-                self.status = BotStatus.ACTIVE
-                result = await self.execute_command(command)
-                
-                # Send result back to director if needed
-                if self.director_connection:
-                    await self._send_to_director({
-                        'type': 'command_result',
-                        'command_id': command.command_id,
-                        'result': result
-                    })
-                
-                self.status = BotStatus.IDLE
-                
-            except asyncio.TimeoutError:
-                # No commands, continue loop
-                continue
-            except Exception as e:
-                self.logger.error(f"Command loop error: {e}")
-                self.status = BotStatus.ERROR
+            # Sleep until commands arrive (or stop() wakes us), then drain everything queued
+            await self.command_queue.wait()
+            
+            while self.is_running and self.command_queue:
+                command = self.command_queue.popleft()
+                try:
+                    self.status = BotStatus.ACTIVE
+                    result = await self.execute_command(command)
+                    
+                    # Send result back to director if needed
+                    if self.director_connection:
+                        await self._send_to_director({
+                            'type': 'command_result',
+                            'command_id': command.command_id,
+                            'result': result
+                        })
+                    
+                    self.status = BotStatus.IDLE
+                    
+                except Exception as e:
+                    self.logger.error("Command loop error: %s", e)
+                    self.status = BotStatus.ERROR
     
     async def _send_to_director(self, message: Dict[str, Any]):
         """Send message to Director Bot"""
@@ -263,7 +396,7 @@ class SubBot(BaseBotInterface):
             try:
                 await self.director_connection.put(message)
             except Exception as e:
-                self.logger.error(f"Failed to send to director: {e}")
+                self.logger.error("Failed to send to director: %s", e)
 
 # Specialized Sub Bot Implementations
 class AnalyzerBot(SubBot):
@@ -378,7 +511,14 @@ class MonitorBot(SubBot):
             'message': f'Monitoring started for {duration} seconds'
         }
 
-@dataclass
+# Sub Bot class for each creatable bot_type
+BOT_CLASSES = {
+    'analyzer': AnalyzerBot,
+    'generator': GeneratorBot,
+    'monitor': MonitorBot
+}
+
+@dataclass(frozen=True, slots=True)
 class SwarmTemplate:
     """Template for creating bot swarms"""
     name: str
@@ -395,65 +535,57 @@ class BotSwarm:
         self.name = name
         self.template = template
         self.bots: Dict[str, BaseBotInterface] = {}
-        self.created_at = time.time()
+        self.created_at = time.time()  # wall clock, reported to clients
+        self.created_monotonic = time.monotonic()  # for uptime, immune to clock adjustments
         self.status = BotStatus.IDLE
         self.logger = logging.getLogger(f"Swarm.{name}")
     
     def add_bot(self, bot: BaseBotInterface):
         """Add a bot to the swarm"""
         self.bots[bot.bot_id] = bot
-        self.logger.info(f"Added bot {bot.name} to swarm {self.name}")
+        self.logger.info("Added bot %s to swarm %s", bot.name, self.name)
     
     def remove_bot(self, bot_id: str) -> bool:
         """Remove a bot from the swarm"""
         if bot_id in self.bots:
             bot = self.bots.pop(bot_id)
-            self.logger.info(f"Removed bot {bot.name} from swarm {self.name}")
+            self.logger.info("Removed bot %s from swarm %s", bot.name, self.name)
             return True
         return False
     
     async def start_all(self):
         """Start all bots in the swarm"""
         self.status = BotStatus.STARTING
-        tasks = []
-        
-        for bot in self.bots.values():
-            tasks.append(bot.start())
-        
-        await asyncio.gather(*tasks)
+        await run_all(bot.start() for bot in self.bots.values())
         self.status = BotStatus.ACTIVE
-        self.logger.info(f"Started swarm {self.name} with {len(self.bots)} bots")
+        self.logger.info("Started swarm %s with %d bots", self.name, len(self.bots))
     
     async def stop_all(self):
         """Stop all bots in the swarm"""
         self.status = BotStatus.STOPPING
-        tasks = []
-        
-        for bot in self.bots.values():
-            tasks.append(bot.stop())
-        
-        await asyncio.gather(*tasks)
+        await run_all(bot.stop() for bot in self.bots.values())
         self.status = BotStatus.STOPPED
-        self.logger.info(f"Stopped swarm {self.name}")
+        self.logger.info("Stopped swarm %s", self.name)
     
     async def broadcast_command(self, command: BotCommand):
         """Send command to all bots in swarm"""
-        tasks = []
+        # Handlers only read parameters, so every bot shares the one dict instead of a copy each
+        parameters = command.parameters
         for bot in self.bots.values():
-            bot_command = BotCommand(
+            bot.command_queue.put_nowait(BotCommand(
                 command_id=f"{command.command_id}_{bot.bot_id}",
                 command_type=command.command_type,
-                parameters=command.parameters.copy()
-            )
-            tasks.append(bot.command_queue.put(bot_command))
-        
-        await asyncio.gather(*tasks)
+                parameters=parameters
+            ))
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get swarm status"""
-        bot_statuses = {}
-        for bot_id, bot in self.bots.items():
-            bot_statuses[bot_id] = bot.get_status()
+    def get_status(self, bot_statuses: Dict[str, Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get swarm status, reusing bot statuses the caller already built"""
+        if bot_statuses is None:
+            bot_statuses = {}
+        bot_statuses = {
+            bot_id: bot_statuses[bot_id] if bot_id in bot_statuses else bot.get_status()
+            for bot_id, bot in self.bots.items()
+        }
         
         return {
             'swarm_id': self.swarm_id,
@@ -462,7 +594,7 @@ class BotSwarm:
             'bot_count': len(self.bots),
             'bots': bot_statuses,
             'created_at': self.created_at,
-            'uptime': time.time() - self.created_at
+            'uptime': time.monotonic() - self.created_monotonic
         }
 
 class DirectorBot(BaseBotInterface):
@@ -475,10 +607,19 @@ class DirectorBot(BaseBotInterface):
             name="DirectorBot"
         )
         self.sub_bots: Dict[str, BaseBotInterface] = {}
+        # Idle sub-bot ids per type (dicts as ordered sets), kept current by _on_bot_status_change
+        self.idle_bots: Dict[BotType, Dict[str, None]] = {bot_type: {} for bot_type in BotType}
         self.swarms: Dict[str, BotSwarm] = {}
-        self.command_history: List[Dict[str, Any]] = []
+        self.command_history = deque(maxlen=MAX_COMMAND_HISTORY)
         self.result_queue = asyncio.Queue()
-        self.websocket_clients = set()
+        self.websocket_clients: Dict[Any, WebSocketClient] = {}
+        self.broadcast_queue = asyncio.Queue()
+        self._broadcast_task = None
+        self._loop_task = None
+        self._status_dirty = asyncio.Event()
+        # Bumped whenever bots, swarms or their statuses change; keys the cached fleet part of initial_status
+        self.status_version = 0
+        self._fleet_status_cache: tuple = None
         
         # Initialize swarm templates
         self.swarm_templates = self._initialize_swarm_templates()
@@ -536,12 +677,13 @@ class DirectorBot(BaseBotInterface):
         self.metrics.last_activity = time.time()
         self.metrics.commands_executed += 1
         
-        # Log command
-        self.command_history.append({
-            'command': asdict(command),
+        # Log command; keep the entry itself since other commands may be appended while this one awaits
+        history_entry = {
+            'command': command.as_dict(),
             'timestamp': time.time(),
             'status': 'executing'
-        })
+        }
+        self.command_history.append(history_entry)
         
         try:
             handler = self.command_handlers.get(command.command_type)
@@ -549,24 +691,24 @@ class DirectorBot(BaseBotInterface):
                 return await self._handle_delegate_command(command)
             
             result = await handler(command)
+            if command.command_type in STATUS_MUTATING_COMMANDS:
+                self.status_version += 1
             
             # Update command history
-            if self.command_history:
-                self.command_history[-1]['status'] = 'completed'
-                self.command_history[-1]['result'] = result
+            history_entry['status'] = 'completed'
+            history_entry['result'] = result
             
-            # Broadcast status update
-            await self._broadcast_status_update()
+            # Broadcast status update (coalesced with other commands finishing in the same window)
+            self._schedule_status_update()
             
             return result
             
         except Exception as e:
             self.metrics.error_count += 1
-            self.logger.error(f"Director command failed: {e}")
+            self.logger.error("Director command failed: %s", e)
             
-            if self.command_history:
-                self.command_history[-1]['status'] = 'error'
-                self.command_history[-1]['error'] = str(e)
+            history_entry['status'] = 'error'
+            history_entry['error'] = str(e)
             
             return {
                 'status': 'error',
@@ -574,31 +716,32 @@ class DirectorBot(BaseBotInterface):
                 'command_id': command.command_id
             }
     
-    async def _handle_create_bot(self, command: BotCommand) -> Dict[str, Any]:
-        """Create a new Sub Bot"""
-        bot_type = command.parameters.get('bot_type', 'custom')
-        bot_name = command.parameters.get('name')
-        
+    def _create_bot(self, bot_type: str, bot_name: str = None) -> BaseBotInterface:
+        """Construct and register a Sub Bot (synchronous; nothing here awaits)"""
         bot_id = str(uuid.uuid4())
         
         # Create appropriate bot type
-        bot_classes = {
-            'analyzer': AnalyzerBot,
-            'generator': GeneratorBot,
-            'monitor': MonitorBot
-        }
-        
-        bot_class = bot_classes.get(bot_type, SubBot)
+        bot_class = BOT_CLASSES.get(bot_type, SubBot)
         bot = bot_class(bot_id, bot_name)
         
         # Add listener for bot events
         bot.add_listener(self._handle_bot_event)
         
         self.sub_bots[bot_id] = bot
+        bot.status_observer = self._on_bot_status_change
+        if bot.status == BotStatus.IDLE:
+            self.idle_bots[bot.bot_type][bot_id] = None
+        
+        return bot
+    
+    async def _handle_create_bot(self, command: BotCommand) -> Dict[str, Any]:
+        """Create a new Sub Bot"""
+        bot_type = command.parameters.get('bot_type', 'custom')
+        bot = self._create_bot(bot_type, command.parameters.get('name'))
         
         return {
             'status': 'success',
-            'bot_id': bot_id,
+            'bot_id': bot.bot_id,
             'message': f'Created {bot_type} bot: {bot.name}'
         }
     
@@ -620,19 +763,7 @@ class DirectorBot(BaseBotInterface):
                 count = bot_type_config.get('count', 1)
                 
                 for i in range(count):
-                    create_cmd = BotCommand(
-                        command_id=str(uuid.uuid4()),
-                        command_type='create_bot',
-                        parameters={
-                            'bot_type': bot_type,
-                            'name': f'{swarm_name}_{bot_type}_{i+1}'
-                        }
-                    )
-                    
-                    result = await self._handle_create_bot(create_cmd)
-                    if result['status'] == 'success':
-                        bot = self.sub_bots[result['bot_id']]
-                        swarm.add_bot(bot)
+                    swarm.add_bot(self._create_bot(bot_type, f'{swarm_name}_{bot_type}_{i+1}'))
         
         self.swarms[swarm_id] = swarm
         
@@ -703,30 +834,16 @@ class DirectorBot(BaseBotInterface):
         target_bot = command.target_bot
         
         if not target_bot or target_bot not in self.sub_bots:
-            # Find appropriate bot type for command
-            command_to_bot_mapping = {
-                'analyze_code': 'analyzer',
-                'quality_check': 'analyzer',
-                'generate_code': 'generator',
-                'create_tests': 'generator',
-                'health_check': 'monitor',
-                'monitor_system': 'monitor'
-            }
-            
-            preferred_bot_type = command_to_bot_mapping.get(command.command_type)
+            # First idle bot of the type that handles this command
+            preferred_bot_type = COMMAND_BOT_TYPES.get(command.command_type)
             if preferred_bot_type:
-                # Find first available bot of preferred type
-                for bot in self.sub_bots.values():
-                    if (bot.bot_type.value == preferred_bot_type and 
-                        bot.status == BotStatus.IDLE):
-                        target_bot = bot.bot_id
-                        break
+                target_bot = next(iter(self.idle_bots[preferred_bot_type]), None)
         
         if not target_bot or target_bot not in self.sub_bots:
             raise ValueError(f"No suitable bot found for command: {command.command_type}")
         
         bot = self.sub_bots[target_bot]
-        await bot.command_queue.put(command)
+        bot.command_queue.put_nowait(command)
         
         return {
             'status': 'success',
@@ -751,34 +868,54 @@ class DirectorBot(BaseBotInterface):
     
     async def _handle_get_status(self, command: BotCommand) -> Dict[str, Any]:
         """Get comprehensive system status"""
-        bot_statuses = {}
-        swarm_statuses = {}
-        
-        for bot_id, bot in self.sub_bots.items():
-            bot_statuses[bot_id] = bot.get_status()
-        
-        for swarm_id, swarm in self.swarms.items():
-            swarm_statuses[swarm_id] = swarm.get_status()
-        
+        return self._system_status()
+    
+    def _system_status(self) -> Dict[str, Any]:
+        """Build the full director, bot and swarm status report"""
         return {
             'status': 'success',
             'director': self.get_status(),
+            **self._fleet_status()
+        }
+    
+    def _fleet_status(self) -> Dict[str, Any]:
+        """Build the bot, swarm and template part of the status report"""
+        bot_statuses = {bot_id: bot.get_status() for bot_id, bot in self.sub_bots.items()}
+        # Swarm members are sub-bots too; share their status dicts instead of building them twice
+        swarm_statuses = {
+            swarm_id: swarm.get_status(bot_statuses)
+            for swarm_id, swarm in self.swarms.items()
+        }
+        
+        return {
             'bots': bot_statuses,
             'swarms': swarm_statuses,
             'templates': list(self.swarm_templates.keys())
         }
     
+    def get_initial_status_frame(self, codec: str = 'json'):
+        """Encode the initial_status frame, reusing the fleet report until status_version moves"""
+        cached = self._fleet_status_cache
+        if cached is None or cached[0] != self.status_version:
+            cached = self._fleet_status_cache = (self.status_version, self._fleet_status())
+        
+        # The director's uptime and command metrics change without a version bump, so they are always fresh
+        data = {'status': 'success', 'director': self.get_status(), **cached[1]}
+        return encode_frame({'type': 'initial_status', 'data': data}, codec)
+    
     async def _handle_list_bots(self, command: BotCommand) -> Dict[str, Any]:
         """List all available bots"""
-        bots = []
-        for bot_id, bot in self.sub_bots.items():
-            bots.append({
+        now = time.monotonic()
+        bots = [
+            {
                 'bot_id': bot_id,
                 'name': bot.name,
                 'type': bot.bot_type.value,
                 'status': bot.status.value,
-                'uptime': time.time() - bot.created_at
-            })
+                'uptime': now - bot.created_monotonic
+            }
+            for bot_id, bot in self.sub_bots.items()
+        ]
         
         return {
             'status': 'success',
@@ -788,15 +925,17 @@ class DirectorBot(BaseBotInterface):
     
     async def _handle_list_swarms(self, command: BotCommand) -> Dict[str, Any]:
         """List all available swarms"""
-        swarms = []
-        for swarm_id, swarm in self.swarms.items():
-            swarms.append({
+        now = time.monotonic()
+        swarms = [
+            {
                 'swarm_id': swarm_id,
                 'name': swarm.name,
                 'status': swarm.status.value,
                 'bot_count': len(swarm.bots),
-                'uptime': time.time() - swarm.created_at
-            })
+                'uptime': now - swarm.created_monotonic
+            }
+            for swarm_id, swarm in self.swarms.items()
+        ]
         
         return {
             'status': 'success',
@@ -804,64 +943,144 @@ class DirectorBot(BaseBotInterface):
             'total': len(swarms)
         }
     
+    def _on_bot_status_change(self, bot: BaseBotInterface, old_status: BotStatus, new_status: BotStatus):
+        """Keep the idle-bot index in step with sub-bot status changes"""
+        self.status_version += 1
+        if new_status == BotStatus.IDLE:
+            self.idle_bots[bot.bot_type][bot.bot_id] = None
+        elif old_status == BotStatus.IDLE:
+            self.idle_bots[bot.bot_type].pop(bot.bot_id, None)
+    
     def _handle_bot_event(self, bot_id: str, event_type: str, data: Dict[str, Any]):
         """Handle events from Sub Bots"""
-        self.logger.info(f"Bot event: {bot_id} - {event_type}")
+        self.logger.info("Bot event: %s - %s", bot_id, event_type)
         
-        # Broadcast event to connected clients
-        asyncio.create_task(self._broadcast_bot_event({
+        # Broadcast event to connected clients; enqueue directly instead of spawning a task per event
+        self._enqueue_broadcast({
             'type': 'bot_event',
             'bot_id': bot_id,
             'event': event_type,
             'data': data,
             'timestamp': time.time()
-        }))
+        })
     
-    async def _broadcast_status_update(self):
-        """Broadcast status update to all connected clients"""
-        status_data = {
+    def _status_update_payload(self) -> Dict[str, Any]:
+        """Build a status update message"""
+        return {
             'type': 'status_update',
             'timestamp': time.time(),
             'director_status': self.get_status(),
             'bot_count': len(self.sub_bots),
             'swarm_count': len(self.swarms)
         }
-        
-        await self._broadcast_to_websockets(status_data)
     
-    async def _broadcast_bot_event(self, event_data: Dict[str, Any]):
-        """Broadcast bot event to websocket clients"""
-        await self._broadcast_to_websockets(event_data)
+    async def _broadcast_status_update(self):
+        """Broadcast status update to all connected clients"""
+        if self.websocket_clients:
+            self._enqueue_broadcast(self._status_update_payload())
+    
+    def _schedule_status_update(self):
+        """Mark status as changed so the director loop broadcasts it"""
+        if not self.websocket_clients:
+            return
+        if self._loop_task is None:
+            # Director was never started (e.g. served straight from get_director_bot()): no loop to wake
+            self._enqueue_broadcast(self._status_update_payload())
+        else:
+            self._status_dirty.set()
     
     async def _broadcast_to_websockets(self, data: Dict[str, Any]):
-        """Broadcast data to all connected websocket clients"""
+        """Queue data for broadcast to all connected websocket clients"""
+        self._enqueue_broadcast(data)
+    
+    def _enqueue_broadcast(self, data: Dict[str, Any]):
+        """Hand data to the broadcast worker, starting it if needed"""
         if not self.websocket_clients:
             return
         
-        message = json.dumps(data)
-        disconnected_clients = set()
-        
-        for client in self.websocket_clients.copy():
+        self.broadcast_queue.put_nowait(data)
+        if self._broadcast_task is None or self._broadcast_task.done():
+            self._broadcast_task = asyncio.create_task(self._broadcast_worker())
+    
+    async def _broadcast_worker(self):
+        """Send queued broadcasts, coalescing everything queued since the last send into one frame"""
+        while True:
+            batch = [await self.broadcast_queue.get()]
+            while True:
+                try:
+                    batch.append(self.broadcast_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            try:
+                self._send_to_websockets(batch)
+            except Exception as e:
+                self.logger.error("Broadcast worker error: %s", e)
+    
+    def _send_to_websockets(self, events: List[Dict[str, Any]]):
+        """Queue events on every subscribed client's relay, encoding once per codec and subscription"""
+        frames = {}
+        
+        for client in tuple(self.websocket_clients.values()):
+            key = (client.codec, client.topics)
+            if key in frames:
+                frame = frames[key]
+            else:
+                selected = events if client.topics is None else [event for event in events if client.wants(event)]
+                if not selected:
+                    frame = None
+                else:
+                    payload = selected[0] if len(selected) == 1 else {'type': 'batch', 'events': selected}
+                    frame = encode_frame(payload, client.codec)
+                frames[key] = frame
+            if frame is None:
+                continue
+            if client.queue.full():
+                # Slow client: newest wins, drop its oldest pending frame
+                client.queue.get_nowait()
+                self.logger.debug("Dropped oldest frame for slow websocket client %s", client.websocket.remote_address)
+            client.queue.put_nowait(frame)
+    
+    async def _relay_to_client(self, client: WebSocketClient):
+        """Forward queued frames to a single websocket client"""
+        while True:
+            frame = await client.queue.get()
             try:
-                await client.send(message)
+                await client.websocket.send(frame)
             except websockets.exceptions.ConnectionClosed:
-                disconnected_clients.add(client)
+                break
             except Exception as e:
-                self.logger.error(f"Broadcast error: {e}")
-                disconnected_clients.add(client)
+                self.logger.error("Broadcast error: %s", e)
+                break
         
-        # Remove disconnected clients
-        self.websocket_clients -= disconnected_clients
+        self.websocket_clients.pop(client.websocket, None)
     
-    def add_websocket_client(self, websocket):
+    def add_websocket_client(self, websocket, codec: str = 'json'):
         """Add websocket client for real-time updates"""
-        self.websocket_clients.add(websocket)
-        self.logger.info(f"Added websocket client. Total: {len(self.websocket_clients)}")
+        client = WebSocketClient(websocket=websocket, codec=codec)
+        client.relay_task = asyncio.create_task(self._relay_to_client(client))
+        self.websocket_clients[websocket] = client
+        self.logger.info("Added websocket client. Total: %s", len(self.websocket_clients))
+    
+    def subscribe_websocket_client(self, websocket, topics: Optional[List[str]]) -> Dict[str, Any]:
+        """Limit a client's broadcasts to the given topics; an empty or missing list means everything"""
+        client = self.websocket_clients.get(websocket)
+        if client is None:
+            return {'status': 'error', 'message': 'Websocket client not registered'}
+        if topics is not None and (
+            not isinstance(topics, (list, tuple)) or not all(isinstance(topic, str) for topic in topics)
+        ):
+            return {'status': 'error', 'message': 'topics must be a list of strings'}
+        
+        client.topics = frozenset(topics) if topics else None
+        return {'status': 'success', 'topics': sorted(client.topics) if client.topics else []}
     
     def remove_websocket_client(self, websocket):
         """Remove websocket client"""
-        self.websocket_clients.discard(websocket)
-        self.logger.info(f"Removed websocket client. Total: {len(self.websocket_clients)}")
+        client = self.websocket_clients.pop(websocket, None)
+        if client and client.relay_task:
+            client.relay_task.cancel()
+        self.logger.info("Removed websocket client. Total: %s", len(self.websocket_clients))
     
     async def start(self):
         """Start the Director Bot"""
@@ -870,9 +1089,10 @@ class DirectorBot(BaseBotInterface):
         self.logger.info("Starting Director Bot")
         
         # Start command processing loop
-        asyncio.create_task(self._director_loop())
+        self._loop_task = asyncio.create_task(self._director_loop(), name="director_loop")
         
         self.status = BotStatus.ACTIVE
+        self.status_version += 1
         await self._broadcast_status_update()
     
     async def stop(self):
@@ -890,17 +1110,32 @@ class DirectorBot(BaseBotInterface):
         
         self.is_running = False
         self.status = BotStatus.STOPPED
+        self.status_version += 1
+        # Wake the director loop and wait for it to finish
+        self._status_dirty.set()
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
     
     async def _director_loop(self):
         """Main director processing loop"""
         while self.is_running:
             try:
-                # Periodic status broadcast every 5 seconds
-                await asyncio.sleep(5)
-                await self._broadcast_status_update()
+                # Broadcast when status changes, or as a heartbeat when nothing has
+                try:
+                    await asyncio.wait_for(self._status_dirty.wait(), STATUS_HEARTBEAT_INTERVAL)
+                    # Let a burst of changes settle into a single broadcast
+                    await asyncio.sleep(STATUS_UPDATE_DELAY)
+                except asyncio.TimeoutError:
+                    pass
+                
+                self._status_dirty.clear()
+                if self.is_running:
+                    await self._broadcast_status_update()
                 
             except Exception as e:
-                self.logger.error(f"Director loop error: {e}")
+                self.logger.error("Director loop error: %s", e)
 
 # Global Director Bot instance
 _director_bot = None
@@ -913,56 +1148,52 @@ def get_director_bot() -> DirectorBot:
     return _director_bot
 
 # Websocket handler for real-time communication
-async def websocket_handler(websocket, path):
+async def websocket_handler(websocket, path=None):
     """Handle websocket connections for real-time updates"""
     director = get_director_bot()
-    director.add_websocket_client(websocket)
+    codec = negotiate_codec(websocket, path)
+    director.add_websocket_client(websocket, codec)
     
     try:
-        # Send initial status
-        await websocket.send(json.dumps({
-            'type': 'initial_status',
-            'data': await director.execute_command(BotCommand(
-                command_id=str(uuid.uuid4()),
-                command_type='get_status'
-            ))
-        }))
+        # Send initial status (shared across clients until the status changes)
+        await websocket.send(director.get_initial_status_frame(codec))
         
         # Handle incoming messages
         async for message in websocket:
             try:
-                data = json.loads(message)
+                if len(message) > LARGE_MESSAGE_SIZE:
+                    data = await asyncio.to_thread(decode_frame, message, codec)
+                else:
+                    data = decode_frame(message, codec)
                 command = BotCommand(
-                    command_id=data.get('command_id', str(uuid.uuid4())),
+                    command_id=data.get('command_id') or new_command_id(),
                     command_type=data.get('command_type'),
                     parameters=data.get('parameters', {}),
                     target_bot=data.get('target_bot'),
                     target_swarm=data.get('target_swarm')
                 )
                 
-                result = await director.execute_command(command)
+                if command.command_type == 'subscribe':
+                    # Subscriptions belong to this connection, not the director
+                    result = director.subscribe_websocket_client(websocket, command.parameters.get('topics'))
+                else:
+                    result = await director.execute_command(command)
                 
-                await websocket.send(json.dumps({
+                await websocket.send(encode_frame({
                     'type': 'command_result',
                     'command_id': command.command_id,
                     'result': result
-                }))
+                }, codec))
                 
             except json.JSONDecodeError as e:
-                await websocket.send(json.dumps({
-                    'type': 'error',
-                    'message': f'Invalid JSON: {str(e)}'
-                }))
+                await websocket.send(error_frame(f'Invalid JSON: {e}', codec))
             except Exception as e:
-                await websocket.send(json.dumps({
-                    'type': 'error', 
-                    'message': str(e)
-                }))
+                await websocket.send(error_frame(str(e), codec))
                 
     except websockets.exceptions.ConnectionClosed:
         pass
     except Exception as e:
-        logger.error(f"Websocket error: {e}")
+        logger.error("Websocket error: %s", e)
     finally:
         director.remove_websocket_client(websocket)
 
@@ -985,8 +1216,7 @@ if __name__ == "__main__":
             BotCommand("3", "create_bot", parameters={'bot_type': 'monitor', 'name': 'Monitor1'}),
         ]
         
-        for cmd in commands:
-            result = await director.execute_command(cmd)
+        for result in await run_all(director.execute_command(cmd) for cmd in commands):
             print(f"✅ {result['message']}")
         
         print("\n🤖 Creating swarm...")
@@ -1003,9 +1233,9 @@ if __name__ == "__main__":
         status_cmd = BotCommand("5", "get_status")
         status = await director.execute_command(status_cmd)
         print(f"\n📈 System Status:")
-        print(f"  Director: {status['result']['director']['status']}")
-        print(f"  Bots: {len(status['result']['bots'])}")
-        print(f"  Swarms: {len(status['result']['swarms'])}")
+        print(f"  Director: {status['director']['status']}")
+        print(f"  Bots: {len(status['bots'])}")
+        print(f"  Swarms: {len(status['swarms'])}")
         
         print("\n🎯 Demo completed! System is ready for use.")
         
@@ -1020,4 +1250,14 @@ if __name__ == "__main__":
             
         return director
     
-    # Run the demo
\ No newline at end of file
+    # Run the demo; uvloop is POSIX-only, so keep the default loop without it
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
+    try:
+        asyncio.run(demo())
+    except KeyboardInterrupt:
+        print("\n👋 Bot Management System stopped")
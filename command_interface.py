@@ -1,18 +1,26 @@
 # command_interface.py
 
 import logging
+import logging.handlers
+import queue
+import atexit
 import shlex
 import os
+import sys
+import shutil
 import json
 import inspect
 import subprocess
-import time # For mock module
+import datetime
+import signal
+import threading
+from collections import deque
+import time
 
 # Actual module imports
 from self_aware_module import SelfAwareModule
 from self_healing_coding_module import SelfHealingModule, SelfCodingModule
-from text_humanization_module import TextHumanizer
-from ai_text_detection_module import AITextDetector
+# TextHumanizer / AITextDetector pull in the ML stack; they are imported where they are constructed
 
 # --- Logger Setup ---
 # Create logs directory in current working directory for cross-platform compatibility
@@ -20,18 +28,95 @@ LOGS_DIR = os.path.join(os.getcwd(), "logs")
 os.makedirs(LOGS_DIR, exist_ok=True)
 LOG_FILE_CI = os.path.join(LOGS_DIR, "bot_command_interface.log")
 
+LOG_QUEUE_SIZE = 20000 # Records waiting for the log writer thread; newer ones are dropped beyond this
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking or erroring when the queue is full."""
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
 def setup_logger_ci(name, log_file, level=logging.INFO):
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s - %(message)s")
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(formatter)
     logger = logging.getLogger(name)
     logger.setLevel(level)
     if not logger.handlers:
-        logger.addHandler(file_handler)
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s - %(message)s")
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        # Commands only enqueue records; the file writes happen on the listener's thread
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop) # Drains the queue on clean shutdown
+        logger.addHandler(DroppingQueueHandler(log_queue))
     return logger
 
 ci_logger = setup_logger_ci("CommandInterfaceLogger", LOG_FILE_CI)
 
+# Shared encoder for pretty-printed command output (json.dumps with indent builds a new one per call)
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, default=str)
+
+READ_CHUNK_MAX = 16 * 1024 * 1024 # Larger files are read in chunks of this size
+READ_CHUNK_MIN = 64 * 1024 # procfs/sysfs files and FIFOs report st_size 0
+
+def _read_text_file(abs_filepath):
+    """Reads a whole text file with raw os.read calls, bypassing the buffered and text I/O layers."""
+    fd = os.open(abs_filepath, os.O_RDONLY)
+    try:
+        # One read normally returns the whole file; the next one confirms EOF
+        chunk_size = min(max(os.fstat(fd).st_size + 1, READ_CHUNK_MIN), READ_CHUNK_MAX)
+        chunks = []
+        while True:
+            chunk = os.read(fd, chunk_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode("utf-8", errors="replace")
+    if "\r" in text: # Match text-mode open()'s universal newlines
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+SCRIPT_TIMEOUT = 60 # Seconds a run_python_script call may take, including reading its output
+SCRIPT_OUTPUT_LIMIT = 1024 * 1024 # Bytes of stdout/stderr kept per stream; older output is dropped
+
+class _PipeTail(threading.Thread):
+    """Reads a pipe to EOF on a daemon thread, keeping only its last SCRIPT_OUTPUT_LIMIT bytes."""
+    def __init__(self, stream, limit=SCRIPT_OUTPUT_LIMIT):
+        super().__init__(daemon=True)
+        self.stream = stream
+        self.limit = limit
+        self.chunks = deque()
+        self.size = 0
+        self.truncated = False
+
+    def run(self):
+        with self.stream:
+            for chunk in iter(lambda: self.stream.read1(1 << 16), b""):
+                self.chunks.append(chunk)
+                self.size += len(chunk)
+                while self.size - len(self.chunks[0]) >= self.limit:
+                    self.size -= len(self.chunks.popleft())
+                    self.truncated = True
+
+    def text(self):
+        text = b"".join(self.chunks).decode("utf-8", errors="replace")
+        return "[earlier output truncated]\n" + text if self.truncated else text
+
+def _kill_script(proc):
+    """Kills a timed-out script together with any children still holding its pipes."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL) # The script leads its own session (start_new_session)
+        else:
+            proc.kill()
+    except OSError:
+        pass
+    proc.wait()
+
 class CommandInterface:
     def __init__(self, awareness_module=None, coding_module=None, healing_module=None, humanizer_module=None, ai_detector_module=None):
         self.logger = ci_logger
@@ -41,7 +126,7 @@ class CommandInterface:
         self.humanizer_module = humanizer_module
         self.ai_detector_module = ai_detector_module
         
-        self.commands = {
+        handlers = {
             "help": self._handle_help,
             "status": self._handle_status,
             "create_file": self._handle_create_file,
@@ -66,24 +151,54 @@ class CommandInterface:
             "humanize_text": self._handle_humanize_text,
             "detect_ai_text": self._handle_detect_ai_text
         }
+        # name -> (handler, first line of its docstring); docstrings are read once here, not per help call
+        self.commands = {
+            name: (handler, (inspect.getdoc(handler) or "No description available.").splitlines()[0])
+            for name, handler in handlers.items()
+        }
+        # Resolve the script interpreter once instead of a PATH search per run
+        self._python_exe = shutil.which("python3.11") or sys.executable
+        self._help_text = None # Built on first use; reset to None if self.commands changes
+        self._cwd = os.getcwd() # Relative paths resolve against this; call refresh_cwd() after os.chdir()
         self.logger.info("CommandInterface initialized.")
 
+    def refresh_cwd(self):
+        """Re-reads the working directory used to resolve relative paths."""
+        self._cwd = os.getcwd()
+
+    def _abspath(self, filepath):
+        if os.path.isabs(filepath):
+            return os.path.normpath(filepath)
+        return os.path.normpath(os.path.join(self._cwd, filepath))
+
+    def _resolve_existing(self, filepath):
+        """Returns (absolute path, os.stat result), with None for the stat if the path doesn't exist."""
+        abs_filepath = self._abspath(filepath)
+        try:
+            return abs_filepath, os.stat(abs_filepath)
+        except (OSError, ValueError):
+            return abs_filepath, None
+
+    def _build_help_text(self):
+        lines = ["Available commands:"]
+        for cmd, (_, summary) in self.commands.items():
+            lines.append(f"  {cmd}: {summary}")
+            if cmd == "detect_ai_text":
+                 lines.append("    Note: This AI detection model may misclassify human-written text as AI-generated. Interpret results with caution.")
+        return "\n".join(lines) + "\n"
+
     def _handle_help(self, args):
         """Displays available commands and their usage."""
-        help_text = "Available commands:\n"
-        for cmd, handler in self.commands.items():
-            docstring = inspect.getdoc(handler) or "No description available."
-            help_text += f"  {cmd}: {docstring.splitlines()[0]}\n"
-            if cmd == "detect_ai_text":
-                 help_text += "    Note: This AI detection model may misclassify human-written text as AI-generated. Interpret results with caution.\n"
-        return help_text
+        if self._help_text is None:
+            self._help_text = self._build_help_text()
+        return self._help_text
 
     def _handle_status(self, args):
         """Retrieves the bot"s current operational status (requires SelfAwareModule)."""
         if self.awareness_module:
             try:
                 health_report = self.awareness_module.report_health()
-                return json.dumps(health_report, indent=2)
+                return _JSON_ENCODER.encode(health_report)
             except Exception as e:
                 self.logger.error(f"Error getting status from awareness module: {e}")
                 return f"Error retrieving status: {e}"
@@ -96,8 +211,8 @@ class CommandInterface:
         filepath = args[0]
         content = " ".join(args[1:]) if len(args) > 1 else ""
         try:
-            abs_filepath = os.path.abspath(filepath)
-            if os.path.exists(abs_filepath):
+            abs_filepath, st = self._resolve_existing(filepath)
+            if st is not None:
                 return f"Error: File {abs_filepath} already exists."
             with open(abs_filepath, "w") as f:
                 f.write(content)
@@ -115,11 +230,10 @@ class CommandInterface:
             return "Error: Missing filepath. Usage: read_file <filepath>"
         filepath = args[0]
         try:
-            abs_filepath = os.path.abspath(filepath)
-            if not os.path.exists(abs_filepath):
+            abs_filepath, st = self._resolve_existing(filepath)
+            if st is None:
                 return f"Error: File {abs_filepath} not found."
-            with open(abs_filepath, "r") as f:
-                content = f.read()
+            content = _read_text_file(abs_filepath)
             self.logger.info(f"Read file: {abs_filepath}")
             return f"Content of {abs_filepath}:\n{content}"
         except Exception as e:
@@ -135,7 +249,7 @@ class CommandInterface:
         filepath = args[0]
         content = " ".join(args[1:])
         try:
-            abs_filepath = os.path.abspath(filepath)
+            abs_filepath = self._abspath(filepath)
             with open(abs_filepath, "w") as f:
                 f.write(content)
             self.logger.info(f"File content updated: {abs_filepath}")
@@ -153,7 +267,7 @@ class CommandInterface:
         filepath = args[0]
         content_to_append = " ".join(args[1:])
         try:
-            abs_filepath = os.path.abspath(filepath)
+            abs_filepath = self._abspath(filepath)
             with open(abs_filepath, "a") as f:
                 f.write(content_to_append + "\n") 
             self.logger.info(f"Content appended to: {abs_filepath}")
@@ -170,15 +284,15 @@ class CommandInterface:
             return "Error: Missing filepath. Usage: analyze_code <filepath>"
         filepath = args[0]
         if self.coding_module:
-            abs_filepath = os.path.abspath(filepath)
-            if not os.path.exists(abs_filepath):
+            abs_filepath, st = self._resolve_existing(filepath)
+            if st is None:
                 return f"Error: File {abs_filepath} not found for analysis."
             try:
                 analysis_result = self.coding_module.analyze_code_structure(abs_filepath)
                 if "error" in analysis_result:
                     # Corrected f-string to use single quotes for dictionary key
                     return f"Error analyzing code: {analysis_result['error']}"
-                return f"Code analysis for {abs_filepath}:\n{json.dumps(analysis_result, indent=2)}"
+                return f"Code analysis for {abs_filepath}:\n{_JSON_ENCODER.encode(analysis_result)}"
             except Exception as e:
                 self.logger.error(f"Error during code analysis via coding module: {e}")
                 if self.healing_module:
@@ -192,8 +306,8 @@ class CommandInterface:
             return "Error: Missing filepath. Usage: analyze_quality <filepath>"
         filepath = args[0]
         if self.coding_module:
-            abs_filepath = os.path.abspath(filepath)
-            if not os.path.exists(abs_filepath):
+            abs_filepath, st = self._resolve_existing(filepath)
+            if st is None:
                 return f"Error: File {abs_filepath} not found for analysis."
             try:
                 analysis_result = self.coding_module.analyze_code_quality(abs_filepath)
@@ -266,8 +380,8 @@ class CommandInterface:
         refactor_type = args[1]
         
         if self.coding_module:
-            abs_filepath = os.path.abspath(filepath)
-            if not os.path.exists(abs_filepath):
+            abs_filepath, st = self._resolve_existing(filepath)
+            if st is None:
                 return f"Error: File {abs_filepath} not found for refactoring."
             try:
                 # Parse additional parameters
@@ -293,8 +407,8 @@ class CommandInterface:
             return "Error: Missing filepath. Usage: auto_fix <filepath>"
         filepath = args[0]
         if self.coding_module:
-            abs_filepath = os.path.abspath(filepath)
-            if not os.path.exists(abs_filepath):
+            abs_filepath, st = self._resolve_existing(filepath)
+            if st is None:
                 return f"Error: File {abs_filepath} not found for auto-fixing."
             try:
                 fix_result = self.coding_module.auto_fix_issues(abs_filepath)
@@ -328,8 +442,8 @@ class CommandInterface:
             return "Error: Missing filepath. Usage: generate_tests <filepath>"
         filepath = args[0]
         if self.coding_module:
-            abs_filepath = os.path.abspath(filepath)
-            if not os.path.exists(abs_filepath):
+            abs_filepath, st = self._resolve_existing(filepath)
+            if st is None:
                 return f"Error: File {abs_filepath} not found for test generation."
             try:
                 test_code = self.coding_module.generate_unit_tests(abs_filepath)
@@ -340,12 +454,13 @@ class CommandInterface:
                 test_filename = f"test_{os.path.basename(abs_filepath)}"
                 test_filepath = os.path.join(os.path.dirname(abs_filepath), test_filename)
                 
+                preview = test_code[:500] + ('...' if len(test_code) > 500 else '')
                 try:
                     with open(test_filepath, 'w') as f:
                         f.write(test_code)
-                    return f"Generated unit tests and saved to {test_filepath}\n\nGenerated test code:\n{test_code[:500]}{'...' if len(test_code) > 500 else ''}"
+                    return f"Generated unit tests and saved to {test_filepath}\n\nGenerated test code:\n{preview}"
                 except Exception as save_error:
-                    return f"Generated test code but failed to save to file: {save_error}\n\nGenerated code:\n{test_code[:500]}{'...' if len(test_code) > 500 else ''}"
+                    return f"Generated test code but failed to save to file: {save_error}\n\nGenerated code:\n{preview}"
                 
             except Exception as e:
                 self.logger.error(f"Error during test generation via coding module: {e}")
@@ -360,8 +475,8 @@ class CommandInterface:
             return "Error: Insufficient arguments. Usage: patch_code <filepath> \"<old_string>\" \"<new_string>\""
         filepath, old_string, new_string = args[0], args[1], args[2]
         if self.coding_module:
-            abs_filepath = os.path.abspath(filepath)
-            if not os.path.exists(abs_filepath):
+            abs_filepath, st = self._resolve_existing(filepath)
+            if st is None:
                 return f"Error: File {abs_filepath} not found for patching."
             try:
                 success = self.coding_module.apply_simple_code_patch(abs_filepath, old_string, new_string)
@@ -387,8 +502,8 @@ class CommandInterface:
             return f"Error: Invalid JSON value provided for new_value: {new_value_str}"
 
         if self.coding_module:
-            abs_config_filepath = os.path.abspath(config_filepath)
-            if not os.path.exists(abs_config_filepath):
+            abs_config_filepath, st = self._resolve_existing(config_filepath)
+            if st is None:
                 return f"Error: Config file {abs_config_filepath} not found."
             try:
                 success = self.coding_module.modify_config_parameter(abs_config_filepath, param_key, new_value)
@@ -408,34 +523,53 @@ class CommandInterface:
             return "Error: Missing script filepath. Usage: run_python_script <filepath> [script_args...]"
         script_path = args[0]
         script_args = args[1:]
-        abs_script_path = os.path.abspath(script_path)
+        abs_script_path, st = self._resolve_existing(script_path)
         
         # Security check - only allow scripts in current directory tree
-        allowed_root = os.path.abspath(os.getcwd())
+        allowed_root = self._cwd
         if not abs_script_path.startswith(allowed_root):
             return f"Error: Script must be in current directory tree: {abs_script_path}"
 
-        if not os.path.exists(abs_script_path):
+        if st is None:
             return f"Error: Script file {abs_script_path} not found."
         if not abs_script_path.endswith(".py"):
             return f"Error: File {abs_script_path} is not a Python script (.py)."
 
         try:
             self.logger.info(f"Executing Python script: {abs_script_path} with args: {script_args}")
-            python_executable = "python3.11"
-            command = [python_executable, abs_script_path] + script_args
-            result = subprocess.run(command, capture_output=True, text=True, timeout=60)
+            command = (self._python_exe, abs_script_path, *script_args)
+            # Stream both pipes while the script runs instead of buffering everything until exit
+            deadline = time.monotonic() + SCRIPT_TIMEOUT
+            proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 16,
+                                    start_new_session=True)
+            tails = (_PipeTail(proc.stdout), _PipeTail(proc.stderr))
+            for tail in tails:
+                tail.start()
+            try:
+                returncode = proc.wait(timeout=SCRIPT_TIMEOUT)
+                # Background children can keep the pipes open after the script exits; they share the deadline
+                for tail in tails:
+                    tail.join(max(0.0, deadline - time.monotonic()))
+                if any(tail.is_alive() for tail in tails):
+                    raise subprocess.TimeoutExpired(command, SCRIPT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                _kill_script(proc)
+                for tail in tails:
+                    tail.join(1) # Readers are daemon threads; don't wait on pipes something else still holds
+                raise
+            stdout_tail, stderr_tail = tails
+            stdout, stderr = stdout_tail.text(), stderr_tail.text()
             output = f"--- Script: {script_path} ---\n"
-            if result.stdout:
-                output += f"STDOUT:\n{result.stdout}\n"
-            if result.stderr:
-                output += f"STDERR:\n{result.stderr}\n"
-            output += f"Return Code: {result.returncode}"
-            self.logger.info(f"Script {abs_script_path} execution finished. Return code: {result.returncode}")
+            if stdout:
+                output += f"STDOUT:\n{stdout}\n"
+            if stderr:
+                output += f"STDERR:\n{stderr}\n"
+            output += f"Return Code: {returncode}"
+            self.logger.info(f"Script {abs_script_path} execution finished. Return code: {returncode}")
             return output
         except subprocess.TimeoutExpired:
             self.logger.warning(f"Script {abs_script_path} timed out.")
-            return f"Error: Script {abs_script_path} timed out after 60 seconds."
+            return f"Error: Script {abs_script_path} timed out after {SCRIPT_TIMEOUT} seconds."
         except Exception as e:
             self.logger.error(f"Error running script {abs_script_path}: {e}")
             if self.healing_module:
@@ -710,8 +844,9 @@ class CommandInterface:
         command_name = parts[0].lower()
         args_list = parts[1:]
         
-        handler = self.commands.get(command_name)
-        if handler:
+        entry = self.commands.get(command_name)
+        if entry:
+            handler = entry[0]
             self.logger.info(f"Executing command {command_name} with args: {args_list}")
             try:
                 return handler(args_list)
@@ -731,6 +866,8 @@ if __name__ == "__main__":
         awareness_module = SelfAwareModule()
         healing_module = SelfHealingModule(awareness_module=awareness_module)
         coding_module = SelfCodingModule(awareness_module=awareness_module) # Corrected: Removed healing_module
+        from text_humanization_module import TextHumanizer
+        from ai_text_detection_module import AITextDetector
         humanizer_module = TextHumanizer() # Downloads model on init
         ai_detector_module = AITextDetector() # Downloads model on init
         print("All modules initialized.")
@@ -745,7 +882,7 @@ if __name__ == "__main__":
             def handle_error(self, error, context): ci_logger.warning(f"MOCK_HEALING: {error}"); return {}
         class MockCodingModule:
             def analyze_code_structure(self, fp): 
-                if fp == "os.path.expanduser("~") + os.seperror_trigger.py":
+                if fp == error_trigger_path:
                     return {"error": "Simulated analysis error from mock"}
                 return {"mock_analysis": fp}
             def apply_simple_code_patch(self, fp, o, n): return True
@@ -772,28 +909,30 @@ if __name__ == "__main__":
 
     print("Command Interface Test with integrated modules. Type \"exit\" or \"quit\" to stop.")
     
-    dummy_script_path = "os.path.expanduser("~") + os.sepdummy_test_script_ci.py"
+    home_dir = os.path.expanduser("~")
+    test_file_path = os.path.join(home_dir, "testfile_ci.txt")
+    dummy_script_path = os.path.join(home_dir, "dummy_test_script_ci.py")
     with open(dummy_script_path, "w") as f:
         f.write("import sys\nprint(\"Hello from CI dummy script!\")\nprint(f\"Script arguments: {sys.argv[1:]}\")\nsys.exit(0)\n")
 
-    dummy_config_path = "os.path.expanduser("~") + os.sepdummy_config_ci.json"
+    dummy_config_path = os.path.join(home_dir, "dummy_config_ci.json")
     with open(dummy_config_path, "w") as f:
         json.dump({"setting1": "value1", "nested": {"key": "original"}}, f, indent=2)
 
-    error_trigger_path = "os.path.expanduser("~") + os.seperror_trigger.py"
+    error_trigger_path = os.path.join(home_dir, "error_trigger.py")
     with open(error_trigger_path, "w") as f:
         f.write("# This file is used to trigger a simulated error in analyze_code")
 
     test_commands = [
         "help",
         "status",
-        "create_file os.path.expanduser("~") + os.septestfile_ci.txt \"Initial content for CI test\"",
-        "read_file os.path.expanduser("~") + os.septestfile_ci.txt",
+        f"create_file {shlex.quote(test_file_path)} \"Initial content for CI test\"",
+        f"read_file {shlex.quote(test_file_path)}",
         "humanize_text \"This is a simple sentence that I want to make sound more natural.\"",
         "detect_ai_text \"This text was definitely written by a human being, I swear it.\"",
         "detect_ai_text \"Leveraging synergistic paradigms, we aim to optimize bleeding-edge infrastructures.\"",
-        f"analyze_code {dummy_script_path}",
-        f"analyze_code {error_trigger_path}",
+        f"analyze_code {shlex.quote(dummy_script_path)}",
+        f"analyze_code {shlex.quote(error_trigger_path)}",
         "unknown_command_test",
     ]
 
@@ -809,7 +948,7 @@ if __name__ == "__main__":
     print(f"Log file for AI Detector: {ai_detector_module.logger.handlers[0].baseFilename if hasattr(ai_detector_module, 'logger') and ai_detector_module.logger.handlers else 'N/A or Mock'}")
 
     # Cleanup
-    if os.path.exists("os.path.expanduser("~") + os.septestfile_ci.txt"): os.remove("os.path.expanduser("~") + os.septestfile_ci.txt")
+    if os.path.exists(test_file_path): os.remove(test_file_path)
     if os.path.exists(dummy_script_path): os.remove(dummy_script_path)
     if os.path.exists(dummy_config_path): os.remove(dummy_config_path)
     if os.path.exists(error_trigger_path): os.remove(error_trigger_path)
@@ -29,7 +29,10 @@ import pickle
 import hashlib
 
 # --- Logger Setup ---
-LOG_FILE_SHC = "/home/ubuntu/bot_self_healing_coding.log"
+# Create logs directory in current working directory for cross-platform compatibility
+LOGS_DIR = os.path.join(os.getcwd(), "logs")
+os.makedirs(LOGS_DIR, exist_ok=True)
+LOG_FILE_SHC = os.path.join(LOGS_DIR, "bot_self_healing_coding.log")
 
 def setup_logger_shc(name, log_file, level=logging.INFO):
     formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s - %(message)s")
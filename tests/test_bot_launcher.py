@@ -0,0 +1,69 @@
+"""Tests for the lazily loaded module proxy"""
+
+import logging
+import os
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+bot_launcher = None
+_workdir = None
+_original_cwd = None
+
+
+def setUpModule():
+    # The modules create logs/ in the working directory at import time; keep that out of the repo
+    global bot_launcher, _workdir, _original_cwd
+    _original_cwd = os.getcwd()
+    _workdir = tempfile.TemporaryDirectory()
+    os.chdir(_workdir.name)
+    import bot_launcher as module
+    bot_launcher = module
+
+
+def tearDownModule():
+    os.chdir(_original_cwd)
+    _workdir.cleanup()
+
+
+class LazyModuleTest(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger('test_bot_launcher')
+        self.calls = 0
+
+    def make(self, factory):
+        def counted():
+            self.calls += 1
+            return factory()
+        return bot_launcher.LazyModule(counted, self.logger, 'Example')
+
+    def test_loads_once_on_first_use(self):
+        proxy = self.make(lambda: 'loaded')
+        self.assertEqual(self.calls, 0)
+        self.assertEqual(proxy.upper(), 'LOADED')
+        self.assertEqual(proxy.lower(), 'loaded')
+        self.assertEqual(self.calls, 1)
+
+    def test_load_failure_is_reported_and_cached(self):
+        def missing_dependency():
+            raise ImportError("No module named 'transformers'")
+
+        proxy = self.make(missing_dependency)
+        with self.assertLogs(self.logger, level='ERROR'):
+            with self.assertRaisesRegex(RuntimeError, "Example module is unavailable: No module named 'transformers'"):
+                proxy.humanize_text
+        with self.assertRaisesRegex(RuntimeError, 'Example module is unavailable'):
+            proxy.humanize_text
+        self.assertEqual(self.calls, 1)
+
+    def test_uninitialized_proxy_does_not_recurse(self):
+        proxy = bot_launcher.LazyModule.__new__(bot_launcher.LazyModule)
+        with self.assertRaises(AttributeError):
+            proxy.anything
+
+
+if __name__ == '__main__':
+    unittest.main()
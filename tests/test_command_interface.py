@@ -0,0 +1,93 @@
+"""Smoke tests for the command interface"""
+
+import importlib
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+ci = None
+_workdir = None
+_original_cwd = None
+
+
+def setUpModule():
+    # The modules create logs/ in the working directory at import time; keep that out of the repo
+    global ci, _workdir, _original_cwd
+    _original_cwd = os.getcwd()
+    _workdir = tempfile.TemporaryDirectory()
+    os.chdir(_workdir.name)
+    ci = importlib.import_module('command_interface')
+
+
+def tearDownModule():
+    os.chdir(_original_cwd)
+    _workdir.cleanup()
+
+
+class StubAwareness:
+    def report_health(self):
+        return {'status': 'OK', 'name': 'café'}
+
+
+class CommandInterfaceTest(unittest.TestCase):
+    def setUp(self):
+        self.interface = ci.CommandInterface(awareness_module=StubAwareness())
+
+    def write(self, name, content):
+        path = os.path.join(_workdir.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_help_lists_commands_and_is_cached(self):
+        help_text = self.interface.process_command('help')
+        self.assertIn('  read_file: Reads the content of a specified file.', help_text)
+        self.assertIn('Note: This AI detection model', help_text)
+        self.assertIs(help_text, self.interface.process_command('help'))
+
+    def test_unknown_command(self):
+        self.assertIn('Unknown command', self.interface.process_command('no_such_command'))
+
+    def test_status_uses_shared_encoder(self):
+        self.assertEqual(json.loads(self.interface.process_command('status'))['name'], 'café')
+
+    def test_read_file_resolves_relative_paths(self):
+        path = self.write('notes.txt', 'line one\r\nline two\n')
+        self.assertEqual(
+            self.interface.process_command('read_file notes.txt'),
+            f'Content of {path}:\nline one\nline two\n'
+        )
+        self.assertIn('not found', self.interface.process_command('read_file missing.txt'))
+
+    def test_run_python_script_captures_output(self):
+        self.write('hello_ci.py', 'import sys\nprint("hi", sys.argv[1:])\nsys.exit(3)\n')
+        output = self.interface.process_command('run_python_script hello_ci.py a b')
+        self.assertIn("hi ['a', 'b']", output)
+        self.assertIn('Return Code: 3', output)
+
+    @unittest.skipUnless(hasattr(os, 'killpg'), 'process groups are POSIX-only')
+    def test_run_python_script_timeout_covers_background_children(self):
+        self.write(
+            'spawn_ci.py',
+            'import subprocess, sys\n'
+            'subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])\n'
+        )
+        original_timeout = ci.SCRIPT_TIMEOUT
+        ci.SCRIPT_TIMEOUT = 1
+        try:
+            started = time.monotonic()
+            output = self.interface.process_command('run_python_script spawn_ci.py')
+        finally:
+            ci.SCRIPT_TIMEOUT = original_timeout
+        self.assertIn('timed out after 1 seconds', output)
+        self.assertLess(time.monotonic() - started, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Handshake tests for the standalone websocket server"""
+
+import importlib
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import websockets
+
+from websocket_codec import msgpack
+
+server_module = importlib.import_module('websocket_server')
+
+
+class WebSocketHandshakeTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = await server_module.BotWebSocketServer(host='127.0.0.1', port=0).create_server()
+        port = next(iter(self.server.sockets)).getsockname()[1]
+        self.uri = f'ws://127.0.0.1:{port}'
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_client_without_subprotocol_gets_json(self):
+        async with websockets.connect(self.uri) as ws:
+            self.assertIsNone(ws.subprotocol)
+            await ws.send(json.dumps({'hello': 'world'}))
+            reply = json.loads(await ws.recv())
+        self.assertEqual(reply['type'], 'response')
+        self.assertEqual(reply['echo'], {'hello': 'world'})
+
+    @unittest.skipIf(msgpack is None, 'msgpack not installed')
+    async def test_format_query_selects_msgpack(self):
+        async with websockets.connect(self.uri + '/?format=msgpack') as ws:
+            self.assertIsNone(ws.subprotocol)
+            await ws.send(msgpack.packb({'n': 1}))
+            reply = msgpack.unpackb(await ws.recv())
+        self.assertEqual(reply['echo'], {'n': 1})
+
+    @unittest.skipIf(msgpack is None, 'msgpack not installed')
+    async def test_msgpack_subprotocol_is_negotiated(self):
+        async with websockets.connect(self.uri, subprotocols=['msgpack']) as ws:
+            self.assertEqual(ws.subprotocol, 'msgpack')
+            await ws.send('not a binary frame')
+            reply = msgpack.unpackb(await ws.recv())
+        self.assertEqual(reply['type'], 'error')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Websocket frame encoding shared by the bot management system and the websocket server
+Handles JSON (orjson when available) and optional MessagePack frames
+"""
+
+import json
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+# Websocket frames are encoded with orjson when available. Frames stay text (str)
+# because the web interface parses them with JSON.parse.
+try:
+    import orjson
+
+    def dumps_frame(data: Any) -> str:
+        return orjson.dumps(data).decode()
+
+    loads_frame = orjson.loads
+except ImportError:
+    dumps_frame = json.dumps
+    loads_frame = json.loads
+
+# Clients may negotiate MessagePack binary frames via the 'msgpack' subprotocol
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+WEBSOCKET_SUBPROTOCOLS = ['msgpack', 'json'] if msgpack is not None else ['json']
+
+def encode_frame(data: Any, codec: str = 'json'):
+    """Encode a websocket payload for a client's negotiated codec"""
+    if codec == 'msgpack':
+        return msgpack.packb(data, use_bin_type=True)
+    return dumps_frame(data)
+
+def decode_frame(message, codec: str = 'json') -> Any:
+    """Decode an incoming websocket message for a client's negotiated codec"""
+    if codec == 'msgpack':
+        if isinstance(message, str):
+            # msgpack.unpackb raises TypeError on str; report it like any other malformed frame
+            raise ValueError("Expected a binary frame for msgpack")
+        return msgpack.unpackb(message, raw=False)
+    return loads_frame(message)
+
+# Error frames only vary by message, so the JSON envelope is prebuilt
+_ERROR_FRAME_PREFIX = '{"type":"error","message":'
+
+def error_frame(message: str, codec: str = 'json'):
+    """Encode an error frame, serializing only the message text for JSON clients"""
+    if codec == 'msgpack':
+        return msgpack.packb({'type': 'error', 'message': message}, use_bin_type=True)
+    return _ERROR_FRAME_PREFIX + dumps_frame(message) + '}'
+
+def select_subprotocol(connection, subprotocols):
+    """Handshake hook (websockets 14+): the client's first supported offer, or None for plain JSON"""
+    # Returning None keeps clients that offer no subprotocol (the web UI, ?format= clients) connected
+    for subprotocol in subprotocols:
+        if subprotocol in WEBSOCKET_SUBPROTOCOLS:
+            return subprotocol
+    return None
+
+def negotiate_codec(websocket, path: str = None) -> str:
+    """Pick a connection's codec: subprotocol first, then a ?format= query, else json"""
+    codec = getattr(websocket, 'subprotocol', None)
+    if codec in WEBSOCKET_SUBPROTOCOLS:
+        return codec
+    if path is None:
+        # websockets 14+ handlers get no path argument; it lives on the handshake request
+        request = getattr(websocket, 'request', None)
+        path = getattr(request, 'path', None) if request is not None else getattr(websocket, 'path', None)
+    requested = parse_qs(urlsplit(path or '').query).get('format')
+    if requested and requested[0] in WEBSOCKET_SUBPROTOCOLS:
+        return requested[0]
+    return 'json'
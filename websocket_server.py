@@ -11,10 +11,17 @@ except ImportError:
     print("Error: websockets module not installed. Run: pip install websockets")
     import sys
     sys.exit(1)
-import json
 import logging
 import time
 
+from websocket_codec import (
+    WEBSOCKET_SUBPROTOCOLS, encode_frame, decode_frame, negotiate_codec, select_subprotocol
+)
+
+# websockets 14+ answers 400 to clients offering no subprotocol unless the server selects one itself;
+# the legacy API (<14) already falls back to no subprotocol
+WEBSOCKETS_NEEDS_SELECT_SUBPROTOCOL = int(websockets.__version__.split('.')[0]) >= 14
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,15 +30,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Minimal websocket handler implementation
-async def websocket_handler(websocket, path):
+async def websocket_handler(websocket, path=None):
     """Minimal WebSocket handler for bot management communication"""
-    logger.info(f"New WebSocket connection from {websocket.remote_address}")
+    logger.info("New WebSocket connection from %s", websocket.remote_address)
+    codec = negotiate_codec(websocket, path)
     
     try:
         async for message in websocket:
             try:
-                data = json.loads(message)
-                logger.info(f"Received message: {data}")
+                data = decode_frame(message, codec)
+                logger.info("Received message: %s", data)
                 
                 # Echo response for now
                 response = {
@@ -41,20 +49,20 @@ async def websocket_handler(websocket, path):
                     "timestamp": time.time()
                 }
                 
-                await websocket.send(json.dumps(response))
+                await websocket.send(encode_frame(response, codec))
                 
-            except json.JSONDecodeError:
+            except (ValueError, TypeError):  # JSONDecodeError, msgpack unpack errors, wrong frame type
                 error_response = {
                     "type": "error",
-                    "message": "Invalid JSON format",
+                    "message": "Invalid message format",
                     "timestamp": time.time()
                 }
-                await websocket.send(json.dumps(error_response))
+                await websocket.send(encode_frame(error_response, codec))
                 
     except websockets.exceptions.ConnectionClosed:
         logger.info("WebSocket connection closed")
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
 
 class DirectorBot:
     """Minimal DirectorBot implementation"""
@@ -94,13 +102,7 @@ class BotWebSocketServer:
         await self.director.start()
         
         # Start WebSocket server
-        self.server = await websockets.serve(
-            websocket_handler,
-            self.host,
-            self.port,
-            ping_interval=20,
-            ping_timeout=10
-        )
+        self.server = await self.create_server()
         
         logger.info("✅ WebSocket server started successfully")
         logger.info(f"🌐 Bot Management System available at ws://{self.host}:{self.port}")
@@ -108,6 +110,27 @@ class BotWebSocketServer:
         # Keep server running
         await self.server.wait_closed()
     
+    async def create_server(self):
+        """Bind and return the websockets server without waiting on it"""
+        options = {}
+        if WEBSOCKETS_NEEDS_SELECT_SUBPROTOCOL:
+            options['select_subprotocol'] = select_subprotocol
+        return await websockets.serve(
+            websocket_handler,
+            self.host,
+            self.port,
+            subprotocols=WEBSOCKET_SUBPROTOCOLS,
+            **options,
+            write_limit=2 ** 16,
+            # Cap incoming messages at 256 KiB and stop reading after 32 unprocessed ones
+            max_size=2 ** 18,
+            max_queue=32,
+            # Frames are small JSON/msgpack messages; deflate costs more CPU than it saves
+            compression=None,
+            ping_interval=20,
+            ping_timeout=10
+        )
+    
     async def stop_server(self):
         """Stop the WebSocket server"""
         if self.server:
@@ -134,6 +157,13 @@ async def main():
         await server.stop_server()
 
 if __name__ == "__main__":
+    # uvloop is POSIX-only; Windows and installs without it keep the default loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt: